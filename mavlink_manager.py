@@ -32,6 +32,10 @@ class MavlinkManager(QObject):
         # Thread safety for telemetry access
         self.telemetry_lock = threading.Lock()
         
+        self._reset_telemetry()
+    
+    def _reset_telemetry(self):
+        """Clear telemetry and battery-source state (per vehicle connection)"""
         # Flag: once BATTERY_STATUS is received, ignore SYS_STATUS for
         # voltage/current because BATTERY_STATUS is more accurate (cell-level).
         self._has_battery_status = False
@@ -67,6 +71,11 @@ class MavlinkManager(QObject):
     
     def connect(self, port, baudrate=57600, retries=3):
         """Connect to drone via MAVLink with retry logic"""
+        # The manager may be reused across connections: start from clean
+        # telemetry rather than the previous vehicle's last values
+        with self.telemetry_lock:
+            self._reset_telemetry()
+        
         for attempt in range(retries):
             try:
                 print(f"[MAVLink] Connection attempt {attempt + 1}/{retries}...")
@@ -136,6 +145,9 @@ class MavlinkManager(QObject):
         if self.connection:
             self.connection.close()
             self.connection = None
+        
+        with self.telemetry_lock:
+            self._reset_telemetry()
             
         self.connection_status_changed.emit(False)
     
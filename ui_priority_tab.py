@@ -3,30 +3,42 @@ Priority Tab - Display and manage priority list based on detected human conditio
 Shows person snapshot images alongside priority information.
 """
 
-import os
+import sys
+import time
 from datetime import datetime
+from itertools import count
+from operator import attrgetter
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
     QLineEdit, QLabel, QMessageBox, QGroupBox,
     QScrollArea, QFrame, QCheckBox, QSizePolicy
 )
 from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QColor, QFont, QPixmap
+from PyQt5.QtGui import QColor, QFont, QImageReader, QPixmap, QPixmapCache
 
 
 class PriorityItem:
     """Data class for priority items"""
 
+    # Long flights accumulate many items; slots keep each one small
+    __slots__ = ("condition", "description", "posture_type", "priority_score",
+                 "tracker_id", "gps_coords", "image_path", "timestamp", "uid")
+
+    _uid_counter = count()
+
     def __init__(self, condition, description, posture_type, priority_score,
                  tracker_id, gps_coords=None, image_path=None, timestamp=None):
-        self.condition = condition
+        # Conditions/postures come from a small fixed vocabulary
+        self.condition = sys.intern(condition)
         self.description = description
-        self.posture_type = posture_type
+        self.posture_type = sys.intern(posture_type)
         self.priority_score = priority_score
         self.tracker_id = tracker_id
         self.gps_coords = gps_coords
         self.image_path = image_path
         self.timestamp = timestamp or datetime.now()
+        # Stable identity for UI callbacks (tracker_id is -1 for manual items)
+        self.uid = next(PriorityItem._uid_counter)
 
     def to_display_string(self):
         """Convert to display string"""
@@ -39,73 +51,114 @@ class PriorityItem:
                 f"Person #{self.tracker_id} {self.posture_type}{gps_str} ({time_str})")
 
 
+# Highest score first; ties go to the most recent detection
+_PRIORITY_SORT_KEY = attrgetter("priority_score", "timestamp")
+
+
 # ────────────────────────────────────────────────────────────────────────
 # Visual card widget for a single priority item
 # ────────────────────────────────────────────────────────────────────────
+_CONDITION_COLORS = {
+    "Critical": "#ff4444",
+    "Warning":  "#ffaa00",
+    "Normal":   "#44ff44",
+    "Unknown":  "#aaaaaa",
+    "Manual":   "#66bbff",
+}
+
+
+def _card_styles(cond_color):
+    """Return the (frame, badge, score) stylesheets for one condition colour."""
+    return (
+        f"PriorityCardWidget {{ background-color: #1e1e1e; "
+        f"border: 2px solid {cond_color}; border-radius: 6px; }}",
+        f"background-color: {cond_color}; color: #000; font-weight: bold; "
+        f"font-size: 11px; border-radius: 3px; padding: 2px 6px;",
+        f"color: {cond_color}; font-size: 12px; font-weight: bold; background: transparent;",
+    )
+
+
+# Stylesheets are materialised once per condition and shared by every card
+_CARD_STYLES = {cond: _card_styles(color) for cond, color in _CONDITION_COLORS.items()}
+_DEFAULT_CARD_STYLES = _card_styles("#ffffff")
+
+
+def _load_thumbnail(path, size):
+    """Load ``path`` as a pixmap fitted inside ``size``.
+
+    The image is decoded directly at the target size where the format allows
+    it (JPEG decodes at a reduced DCT scale), so full-resolution snapshots are
+    never materialised just to be shrunk. Returns a null pixmap on failure.
+
+    Results are kept in ``QPixmapCache`` keyed by path and size. Snapshot
+    names are timestamped, so a path is never rewritten in place. Failed loads
+    are cached as a null pixmap so missing files are not retried on every
+    refresh.
+    """
+    key = f"priority_thumb:{size.width()}x{size.height()}:{path}"
+    cached = QPixmapCache.find(key)
+    if cached is not None:
+        return cached
+
+    reader = QImageReader(path)
+    src_size = reader.size()
+    pix = None
+    if src_size.isValid():
+        reader.setScaledSize(src_size.scaled(size, Qt.KeepAspectRatio))
+        img = reader.read()
+        if not img.isNull():
+            pix = QPixmap.fromImage(img)
+
+    if pix is None:
+        # Fallback: full decode followed by a smooth rescale
+        pix = QPixmap(path)
+        if not pix.isNull():
+            pix = pix.scaled(size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+    QPixmapCache.insert(key, pix)
+    return pix
+
+
 class PriorityCardWidget(QFrame):
-    """Rich card showing snapshot image + priority info for one item."""
+    """Rich card showing snapshot image + priority info for one item.
+
+    The widget tree is built once; ``bind()`` refills it so cards can be
+    pooled and reused across refreshes.
+    """
 
-    remove_requested = pyqtSignal(int)  # index
+    remove_requested = pyqtSignal(int)  # item uid
 
-    _CONDITION_COLORS = {
-        "Critical": "#ff4444",
-        "Warning":  "#ffaa00",
-        "Normal":   "#44ff44",
-        "Unknown":  "#aaaaaa",
-        "Manual":   "#66bbff",
-    }
+    _THUMB_CSS = "background-color: #111; border: 1px solid #444; border-radius: 4px;"
+    _NO_IMAGE_CSS = (
+        "background-color: #111; border: 1px solid #444; "
+        "border-radius: 4px; color: #888; font-size: 10px;"
+    )
 
-    def __init__(self, item: PriorityItem, index: int):
+    def __init__(self, item: PriorityItem = None):
         super().__init__()
-        self._item = item
-        self._index = index
+        self._item = None
         self._init_ui()
+        if item is not None:
+            self.bind(item)
 
-    def _init_ui(self):
-        item = self._item
-        cond_color = self._CONDITION_COLORS.get(item.condition, "#ffffff")
+    def _on_remove(self):
+        if self._item is not None:
+            self.remove_requested.emit(self._item.uid)
 
+    def _init_ui(self):
         self.setFrameStyle(QFrame.StyledPanel | QFrame.Raised)
-        self.setStyleSheet(
-            f"PriorityCardWidget {{ background-color: #1e1e1e; "
-            f"border: 2px solid {cond_color}; border-radius: 6px; }}"
-        )
 
         root = QHBoxLayout(self)
         root.setContentsMargins(6, 6, 6, 6)
         root.setSpacing(10)
 
         # ── Snapshot thumbnail (left) ──
-        thumb_label = QLabel()
-        thumb_label.setMinimumSize(80, 96)
-        thumb_label.setMaximumSize(130, 156)
-        thumb_label.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
-        thumb_label.setAlignment(Qt.AlignCenter)
-        thumb_label.setStyleSheet(
-            "background-color: #111; border: 1px solid #444; border-radius: 4px;"
-        )
-
-        if item.image_path and os.path.exists(item.image_path):
-            pix = QPixmap(item.image_path)
-            if not pix.isNull():
-                thumb_label.setPixmap(
-                    pix.scaled(thumb_label.size(), Qt.KeepAspectRatio,
-                               Qt.SmoothTransformation)
-                )
-            else:
-                thumb_label.setText("No image")
-                thumb_label.setStyleSheet(
-                    "background-color: #111; border: 1px solid #444; "
-                    "border-radius: 4px; color: #888; font-size: 10px;"
-                )
-        else:
-            thumb_label.setText("No image")
-            thumb_label.setStyleSheet(
-                "background-color: #111; border: 1px solid #444; "
-                "border-radius: 4px; color: #888; font-size: 10px;"
-            )
-
-        root.addWidget(thumb_label)
+        self._thumb_label = QLabel()
+        self._thumb_label.setMinimumSize(80, 96)
+        self._thumb_label.setMaximumSize(130, 156)
+        self._thumb_label.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+        self._thumb_label.setAlignment(Qt.AlignCenter)
+        root.addWidget(self._thumb_label)
 
         # ── Info column (right) ──
         info = QVBoxLayout()
@@ -113,47 +166,31 @@ class PriorityCardWidget(QFrame):
 
         # Row 1 – Person ID + condition badge
         row1 = QHBoxLayout()
-        id_lbl = QLabel(
-            f"Person #{item.tracker_id}" if item.tracker_id >= 0 else "Manual Entry"
-        )
-        id_lbl.setStyleSheet(
+        self._id_lbl = QLabel()
+        self._id_lbl.setStyleSheet(
             "font-weight: bold; font-size: 13px; color: #4a90e2; background: transparent;"
         )
-        row1.addWidget(id_lbl)
+        row1.addWidget(self._id_lbl)
         row1.addStretch()
 
-        badge = QLabel(f"  {item.condition}  ")
-        badge.setStyleSheet(
-            f"background-color: {cond_color}; color: #000; font-weight: bold; "
-            f"font-size: 11px; border-radius: 3px; padding: 2px 6px;"
-        )
-        row1.addWidget(badge)
+        self._badge = QLabel()
+        row1.addWidget(self._badge)
         info.addLayout(row1)
 
         # Row 2 – Posture + Score
-        score_lbl = QLabel(
-            f"Posture: {item.posture_type}   |   Score: {item.priority_score}/100"
-        )
-        score_lbl.setStyleSheet(
-            f"color: {cond_color}; font-size: 12px; font-weight: bold; background: transparent;"
-        )
-        info.addWidget(score_lbl)
+        self._score_lbl = QLabel()
+        info.addWidget(self._score_lbl)
 
         # Row 3 – Description
-        desc_lbl = QLabel(item.description)
-        desc_lbl.setWordWrap(True)
-        desc_lbl.setStyleSheet("color: #cccccc; font-size: 11px; background: transparent;")
-        info.addWidget(desc_lbl)
+        self._desc_lbl = QLabel()
+        self._desc_lbl.setWordWrap(True)
+        self._desc_lbl.setStyleSheet("color: #cccccc; font-size: 11px; background: transparent;")
+        info.addWidget(self._desc_lbl)
 
         # Row 4 – GPS + Timestamp
-        meta_parts = []
-        if item.gps_coords:
-            lat, lon = item.gps_coords
-            meta_parts.append(f"\U0001f4cd {lat:.6f}, {lon:.6f}")
-        meta_parts.append(f"\U0001f552 {item.timestamp.strftime('%H:%M:%S')}")
-        meta_lbl = QLabel("   ".join(meta_parts))
-        meta_lbl.setStyleSheet("color: #888; font-size: 10px; background: transparent;")
-        info.addWidget(meta_lbl)
+        self._meta_lbl = QLabel()
+        self._meta_lbl.setStyleSheet("color: #888; font-size: 10px; background: transparent;")
+        info.addWidget(self._meta_lbl)
 
         info.addStretch()
 
@@ -165,7 +202,7 @@ class PriorityCardWidget(QFrame):
             "QPushButton { background: #555; color: #fff; border-radius: 11px; font-size: 11px; }"
             "QPushButton:hover { background: #e74c3c; }"
         )
-        rm_btn.clicked.connect(lambda: self.remove_requested.emit(self._index))
+        rm_btn.clicked.connect(self._on_remove)
 
         btn_col = QVBoxLayout()
         btn_col.addWidget(rm_btn)
@@ -174,6 +211,42 @@ class PriorityCardWidget(QFrame):
         root.addLayout(info, 1)
         root.addLayout(btn_col)
 
+    def bind(self, item: PriorityItem):
+        """Show ``item`` in this card, reusing the existing child widgets."""
+        self._item = item
+        frame_css, badge_css, score_css = _CARD_STYLES.get(
+            item.condition, _DEFAULT_CARD_STYLES
+        )
+        self.setStyleSheet(frame_css)
+
+        thumb_label = self._thumb_label
+        # A missing file simply yields a null pixmap; no separate stat() call
+        pix = _load_thumbnail(item.image_path, thumb_label.size()) if item.image_path else None
+        if pix is not None and not pix.isNull():
+            thumb_label.setStyleSheet(self._THUMB_CSS)
+            thumb_label.setPixmap(pix)
+        else:
+            thumb_label.setText("No image")
+            thumb_label.setStyleSheet(self._NO_IMAGE_CSS)
+
+        self._id_lbl.setText(
+            f"Person #{item.tracker_id}" if item.tracker_id >= 0 else "Manual Entry"
+        )
+        self._badge.setText(f"  {item.condition}  ")
+        self._badge.setStyleSheet(badge_css)
+        self._score_lbl.setText(
+            f"Posture: {item.posture_type}   |   Score: {item.priority_score}/100"
+        )
+        self._score_lbl.setStyleSheet(score_css)
+        self._desc_lbl.setText(item.description)
+
+        meta_parts = []
+        if item.gps_coords:
+            lat, lon = item.gps_coords
+            meta_parts.append(f"\U0001f4cd {lat:.6f}, {lon:.6f}")
+        meta_parts.append(f"\U0001f552 {item.timestamp.strftime('%H:%M:%S')}")
+        self._meta_lbl.setText("   ".join(meta_parts))
+
 
 # ────────────────────────────────────────────────────────────────────────
 # Main Priority Tab
@@ -183,10 +256,23 @@ class PriorityTab(QWidget):
 
     request_analysis = pyqtSignal(int)
 
+    # Upper bound on hidden cards kept around for reuse
+    _CARD_POOL_MAX = 64
+
+    _STATS_FMT = "Items: %d | Critical: %d | Warning: %d | Normal: %d"
+
+    # Minimum seconds between critical alerts for the same person
+    _ALERT_COOLDOWN_S = 30.0
+
     def __init__(self, mavlink_manager=None):
         super().__init__()
         self.mavlink_manager = mavlink_manager
         self.priority_items = []
+        self._items_by_uid = {}
+        self._active_cards = []
+        self._card_pool = []
+        self._last_stats = (0, 0, 0, 0)
+        self._alert_cooldown = {}  # tracker_id -> monotonic time of last alert
         self.auto_add_enabled = True
         self.init_ui()
         self.apply_stylesheet()
@@ -289,10 +375,16 @@ class PriorityTab(QWidget):
         controls.addWidget(export_btn)
         main_layout.addLayout(controls)
 
-        self.stats_label = QLabel("Items: 0 | Critical: 0 | Warning: 0 | Normal: 0")
+        self.stats_label = QLabel(self._STATS_FMT % self._last_stats)
         self.stats_label.setStyleSheet("color: #888888; font-size: 10px;")
         main_layout.addWidget(self.stats_label)
 
+        # Single reusable alert dialog, refilled for each critical detection
+        self._alert_box = QMessageBox(self)
+        self._alert_box.setIcon(QMessageBox.Critical)
+        self._alert_box.setWindowTitle("\u26a0\ufe0f Critical Priority Detected")
+        self._alert_box.setStandardButtons(QMessageBox.Ok)
+
     @staticmethod
     def _button_style(color):
         return (
@@ -322,6 +414,7 @@ class PriorityTab(QWidget):
                     self._refresh_cards()
                 return
         self.priority_items.append(priority_item)
+        self._items_by_uid[priority_item.uid] = priority_item
         self._refresh_cards()
         if priority_item.condition == "Critical":
             self._show_critical_alert(priority_item)
@@ -335,6 +428,7 @@ class PriorityTab(QWidget):
             priority_score=50, tracker_id=-1, timestamp=datetime.now()
         )
         self.priority_items.append(manual_item)
+        self._items_by_uid[manual_item.uid] = manual_item
         self.input_edit.clear()
         self._refresh_cards()
 
@@ -344,24 +438,53 @@ class PriorityTab(QWidget):
             QMessageBox.Yes | QMessageBox.No
         ) == QMessageBox.Yes:
             self.priority_items.clear()
+            self._items_by_uid.clear()
             self._refresh_cards()
 
-    def _remove_item(self, index):
-        if 0 <= index < len(self.priority_items):
-            del self.priority_items[index]
+    def _remove_item(self, uid):
+        item = self._items_by_uid.pop(uid, None)
+        if item is not None:
+            self.priority_items.remove(item)
             self._refresh_cards()
 
     # ── card management ──────────────────────────────────────────────
     def _refresh_cards(self):
-        self.priority_items.sort(key=lambda x: x.priority_score, reverse=True)
-        while self._cards_layout.count() > 1:
-            child = self._cards_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-        for idx, item in enumerate(self.priority_items):
-            card = PriorityCardWidget(item, idx)
-            card.remove_requested.connect(self._remove_item)
-            self._cards_layout.insertWidget(self._cards_layout.count() - 1, card)
+        self.priority_items.sort(key=_PRIORITY_SORT_KEY, reverse=True)
+        active = self._active_cards
+        n_items = len(self.priority_items)
+
+        # Batch all card changes into a single layout pass and repaint
+        self._scroll.setUpdatesEnabled(False)
+        self._cards_layout.setEnabled(False)
+        try:
+            # Park surplus cards in the pool instead of destroying them
+            for card in active[n_items:]:
+                self._cards_layout.removeWidget(card)
+                card.hide()
+                if len(self._card_pool) < self._CARD_POOL_MAX:
+                    self._card_pool.append(card)
+                else:
+                    card.deleteLater()
+            del active[n_items:]
+
+            for idx, item in enumerate(self.priority_items):
+                if idx < len(active):
+                    active[idx].bind(item)
+                    continue
+                if self._card_pool:
+                    card = self._card_pool.pop()
+                else:
+                    card = PriorityCardWidget()
+                    card.remove_requested.connect(self._remove_item)
+                card.bind(item)
+                self._cards_layout.insertWidget(self._cards_layout.count() - 1, card)
+                card.show()
+                active.append(card)
+        finally:
+            self._cards_layout.setEnabled(True)
+            self._cards_layout.activate()
+            self._scroll.setUpdatesEnabled(True)
+            self._cards_container.updateGeometry()
         self._update_stats()
 
     def _update_stats(self):
@@ -369,14 +492,20 @@ class PriorityTab(QWidget):
         critical = sum(1 for x in self.priority_items if x.condition == "Critical")
         warning = sum(1 for x in self.priority_items if x.condition == "Warning")
         normal = sum(1 for x in self.priority_items if x.condition == "Normal")
-        self.stats_label.setText(
-            f"Items: {total} | Critical: {critical} | Warning: {warning} | Normal: {normal}"
-        )
+        stats = (total, critical, warning, normal)
+        if stats == self._last_stats:
+            return
+        self._last_stats = stats
+        self.stats_label.setText(self._STATS_FMT % stats)
 
     def _show_critical_alert(self, item):
-        msg = QMessageBox(self)
-        msg.setIcon(QMessageBox.Critical)
-        msg.setWindowTitle("\u26a0\ufe0f Critical Priority Detected")
+        now = time.monotonic()
+        last = self._alert_cooldown.get(item.tracker_id)
+        if last is not None and now - last < self._ALERT_COOLDOWN_S:
+            return
+        self._alert_cooldown[item.tracker_id] = now
+
+        msg = self._alert_box
         msg.setText(f"Person #{item.tracker_id}: {item.description}")
         gps_text = ""
         if item.gps_coords:
@@ -386,8 +515,8 @@ class PriorityTab(QWidget):
             f"Posture: {item.posture_type}\n"
             f"Priority Score: {item.priority_score}/100{gps_text}"
         )
-        msg.setStandardButtons(QMessageBox.Ok)
-        msg.show()
+        if not msg.isVisible():
+            msg.show()
 
     def export_list(self):
         from PyQt5.QtWidgets import QFileDialog
@@ -400,18 +529,23 @@ class PriorityTab(QWidget):
             "Text Files (*.txt)"
         )
         if filename:
+            # Build the whole report in memory and hand it to a single write()
+            parts = ["=== PRIORITY LIST ===\n", f"Generated: {datetime.now()}\n\n"]
+            for i, item in enumerate(self.priority_items, 1):
+                parts.append(
+                    f"{i}. [{item.priority_score}] {item.condition} - "
+                    f"Person #{item.tracker_id} {item.posture_type} "
+                    f"({item.timestamp.strftime('%H:%M:%S')})\n"
+                    f"   Description: {item.description}\n"
+                )
+                if item.gps_coords:
+                    parts.append(f"   GPS: {item.gps_coords[0]:.6f}, {item.gps_coords[1]:.6f}\n")
+                if item.image_path:
+                    parts.append(f"   Image: {item.image_path}\n")
+                parts.append("\n")
             try:
-                with open(filename, 'w') as f:
-                    f.write("=== PRIORITY LIST ===\n")
-                    f.write(f"Generated: {datetime.now()}\n\n")
-                    for i, item in enumerate(self.priority_items, 1):
-                        f.write(f"{i}. {item.to_display_string()}\n")
-                        f.write(f"   Description: {item.description}\n")
-                        if item.gps_coords:
-                            f.write(f"   GPS: {item.gps_coords[0]:.6f}, {item.gps_coords[1]:.6f}\n")
-                        if item.image_path:
-                            f.write(f"   Image: {item.image_path}\n")
-                        f.write("\n")
+                with open(filename, 'w', buffering=1 << 16) as f:
+                    f.write("".join(parts))
                 QMessageBox.information(self, "Export", f"List exported to:\n{filename}")
             except Exception as e:
                 QMessageBox.critical(self, "Export Error", f"Failed to export:\n{str(e)}")
@@ -4,49 +4,276 @@ Manages waypoint generation from detected humans and mission control for second
 """
 
 import os
-import folium
+import time
+import collections
+import functools
+import threading
+import numpy as np
 from datetime import datetime
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QGroupBox, QListWidget, QSplitter, QGridLayout, QComboBox,
     QMessageBox, QListWidgetItem, QTextEdit, QCheckBox, QSpinBox,
-    QSizePolicy
+    QSizePolicy, QApplication, QListView
 )
-from PyQt5.QtCore import Qt, QTimer, QUrl
-from PyQt5.QtGui import QColor, QFont
+from PyQt5.QtCore import Qt, QTimer, QUrl, QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QColor
 from PyQt5.QtWebEngineWidgets import QWebEngineView
-from mission_upload import upload_mission_to_drone
+
+# folium/branca/jinja2, pymavlink (via mission_upload) and pyserial are
+# imported where they are first used, so building the tab stays cheap
+
+
+# Leaflet layer exposing ``updateDrones()`` so drone markers can be moved
+# with ``runJavaScript`` instead of re-rendering the whole folium page
+_DRONE_MARKERS_TEMPLATE = """
+        {% macro script(this, kwargs) %}
+        (function() {
+            var map = {{ this._parent.get_name() }};
+            var centered = {{ 'true' if this.centered else 'false' }};
+            var markers = {};
+            var styles = {
+                1: {label: 'Drone 1', role: 'Surveillance', color: 'red', icon: 'plane'},
+                2: {label: 'Drone 2', role: 'Rescue', color: 'green', icon: 'helicopter'}
+            };
+            function place(id, lat, lon, alt) {
+                var style = styles[id];
+                var marker = markers[id];
+                if (lat === 0 || lon === 0) {
+                    if (marker) { map.removeLayer(marker); delete markers[id]; }
+                    return;
+                }
+                if (!marker) {
+                    marker = L.marker([lat, lon], {
+                        icon: L.AwesomeMarkers.icon({
+                            icon: style.icon, prefix: 'fa', markerColor: style.color,
+                            iconColor: 'white', extraClasses: 'fa-rotate-0'
+                        })
+                    }).bindTooltip(style.label).bindPopup('').addTo(map);
+                    markers[id] = marker;
+                } else {
+                    marker.setLatLng([lat, lon]);
+                }
+                marker.setPopupContent(
+                    style.label + ' (' + style.role + ')<br>Alt: ' + alt.toFixed(1) + 'm'
+                );
+                if (!centered) {
+                    map.setView([lat, lon], 16);
+                    centered = true;
+                }
+            }
+            window.updateDrones = function(lat1, lon1, alt1, lat2, lon2, alt2) {
+                place(1, lat1, lon1, alt1);
+                place(2, lat2, lon2, alt2);
+            };
+        })();
+        {% endmacro %}
+    """
+
+
+@functools.lru_cache(maxsize=1)
+def _drone_markers_class():
+    """Create the _DroneMarkers element class on first use (imports branca)"""
+    from branca.element import MacroElement
+    from jinja2 import Template
+    
+    class _DroneMarkers(MacroElement):
+        """Drone 1/2 markers driven from JS (see _DRONE_MARKERS_TEMPLATE)"""
+        
+        _template = Template(_DRONE_MARKERS_TEMPLATE)
+        
+        def __init__(self, centered=False):
+            super().__init__()
+            self._name = 'DroneMarkers'
+            self.centered = centered
+    
+    return _DroneMarkers
+
+
+@functools.lru_cache(maxsize=16)
+def _button_style(color):
+    """Generate button stylesheet (memoized; only a handful of colours are used)"""
+    return f"""
+        QPushButton {{
+            background-color: {color};
+            color: white;
+            border: none;
+            border-radius: 4px;
+            padding: 8px 16px;
+            font-weight: bold;
+        }}
+        QPushButton:hover {{
+            background-color: {color}dd;
+        }}
+        QPushButton:pressed {{
+            background-color: {color}bb;
+        }}
+    """
+
+
+def _rescue_layer_style(feature):
+    """Style for the rescue GeoJson layer (route line and waypoint icons)"""
+    return {'color': 'orange', 'weight': 3, 'opacity': 0.7}
+
+
+def _rescue_feature_collection(route, popups, tooltips):
+    """Waypoints (Point features) and the route (LineString) as one GeoJSON dict.
+    
+    ``route`` is the [[lon, lat], ...] list in visiting order; each waypoint
+    Point reuses its pair instead of building a new one.
+    """
+    features = [
+        {
+            'type': 'Feature',
+            'geometry': {'type': 'Point', 'coordinates': coords},
+            'properties': {'popup': popup, 'tooltip': tooltip}
+        }
+        for coords, popup, tooltip in zip(route, popups, tooltips)
+    ]
+    if len(features) > 1:
+        features.append({
+            'type': 'Feature',
+            'geometry': {
+                'type': 'LineString',
+                'coordinates': route
+            },
+            'properties': {'popup': 'Rescue Route', 'tooltip': 'Rescue Route'}
+        })
+    return {'type': 'FeatureCollection', 'features': features}
+
+
+def _build_live_map_html(center_lat, center_lon, zoom, route, popups, tooltips):
+    """Build the rescue live-map page (waypoints, route, drone layer) as HTML"""
+    import folium
+    
+    m = folium.Map(location=[center_lat, center_lon], zoom_start=zoom)
+    
+    # Drone markers are created and moved from JS (see updateDrones)
+    _drone_markers_class()(centered=(zoom != 2)).add_to(m)
+    
+    # Rescue waypoints (orange markers) and route line as a single GeoJson
+    # layer: one template render however many waypoints there are
+    if popups:
+        folium.GeoJson(
+            _rescue_feature_collection(route, popups, tooltips),
+            style_function=_rescue_layer_style,
+            marker=folium.Marker(icon=folium.Icon(color='orange', icon='user', prefix='fa')),
+            popup=folium.GeoJsonPopup(fields=['popup'], labels=False),
+            tooltip=folium.GeoJsonTooltip(fields=['tooltip'], labels=False),
+            control=False,
+        ).add_to(m)
+    
+    return m.get_root().render()
+
+
+# Consistent view of the waypoint columns, taken under waypoints_lock
+_WaypointSnapshot = collections.namedtuple(
+    '_WaypointSnapshot',
+    'version lats lons alts scores descs conditions popups tooltips'
+)
+
+
+class _MapRenderSignals(QObject):
+    """Signals for _MapRenderTask (QRunnable cannot define its own)"""
+    finished = pyqtSignal(int, str, str)  # waypoints version, html ("" on failure), error
+
+
+class _MapRenderTask(QRunnable):
+    """Render the live-map HTML on a pool thread so folium never blocks the UI"""
+    
+    def __init__(self, version, center_lat, center_lon, zoom, route, popups, tooltips):
+        super().__init__()
+        self.signals = _MapRenderSignals()
+        self._version = version
+        self._args = (center_lat, center_lon, zoom, route, popups, tooltips)
+    
+    def run(self):
+        try:
+            html, error = _build_live_map_html(*self._args), ""
+        except Exception as e:
+            html, error = "", str(e) or type(e).__name__
+        self.signals.finished.emit(self._version, html, error)
 
 
 class SecondDroneTab(QWidget):
     """Tab for managing second drone (rescue/response drone)"""
     
+    # Repeated Scan clicks within this window reuse the last port list
+    _PORT_CACHE_TTL_S = 1.0
+    
+    # Render attempts per waypoint version before the live map gives up on it
+    # (retried once the waypoints change)
+    _MAX_RENDER_ATTEMPTS = 3
+    
     def __init__(self, mavlink_manager_drone1, priority_tab=None):
         super().__init__()
         self.mavlink_manager_drone1 = mavlink_manager_drone1  # First drone connection
         self.priority_tab = priority_tab
         
-        # Thread safety for waypoint management
-        import threading
-        self.waypoints_lock = threading.Lock()
+        # Thread safety for waypoint management: every read or write of the
+        # waypoint columns/dicts goes through this lock (re-entrant so helpers
+        # can be called while it is held)
+        self.waypoints_lock = threading.RLock()
         
-        # Second drone connection (separate MAVLink connection)
-        self.mavlink_manager_drone2 = None
+        # Second drone connection (separate MAVLink connection), created once
+        # and reused across connect/disconnect cycles
+        from mavlink_manager import MavlinkManager
+        self.mavlink_manager_drone2 = MavlinkManager()
         self.drone2_port =  None
+        self._ports_cache = (float('-inf'), [])  # (monotonic time, [(device, description)])
         
         # Waypoint management
-        self.rescue_waypoints = []  # List of (lat, lon, alt, description)
+        # Waypoints are stored column-wise (one array per field, in visiting
+        # order); rescue_waypoints holds the equivalent dicts for mission upload
+        self.rescue_waypoints = []
+        self._waypoints_version = 0  # Bumped whenever rescue_waypoints changes
+        self._set_waypoint_arrays(
+            np.empty(0, np.float64), np.empty(0, np.float64),
+            np.empty(0, np.float32), np.empty(0, np.int32), [], []
+        )
         self.mission_altitude = 30  # Default altitude for rescue mission
         
+        # Live map state: the folium page is rebuilt only for new waypoints,
+        # drone positions are pushed into it over JS when they change
+        self._rendered_waypoints_version = -1
+        self._last_map_key = None
+        self._map_dirty = True  # Set by telemetry signals, cleared by the map timer
+        self._render_pool = QThreadPool.globalInstance()
+        self._render_inflight = False
+        self._render_task = None
+        self._failed_render_version = -1  # Waypoint version whose render failed
+        self._render_failures = 0  # Consecutive failures for that version
+        self._route_cache = []  # [[lon, lat], ...] for _route_cache_version
+        self._route_cache_version = -1
+        
         # UI state
         self.is_connected = False
         
+        # Status lines are queued here and flushed to the log view in batches
+        self._log_buffer = collections.deque(maxlen=500)
+        
+        # Latest Drone 2 telemetry; labels are refreshed from it at 10 Hz
+        self._last_telemetry = None
+        self._last_flushed = None
+        
         self.init_ui()
         
-        # Map update timer
+        self._log_timer = QTimer(self)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._log_timer.start(100)
+        
+        self._telemetry_timer = QTimer(self)
+        self._telemetry_timer.timeout.connect(self._flush_telemetry)
+        self._telemetry_timer.start(100)
+        
+        # Map refresh is driven by telemetry signals; the timer only coalesces
+        # them so the map is touched at most twice a second
+        self.mavlink_manager_drone1.telemetry_updated.connect(self._on_telemetry_changed)
+        self.mavlink_manager_drone2.telemetry_updated.connect(self.update_telemetry)
+        self.mavlink_manager_drone2.telemetry_updated.connect(self._on_telemetry_changed)
         self.map_timer = QTimer()
-        self.map_timer.timeout.connect(self.update_live_map)
-        self.map_timer.start(2000)  # Update every 2 seconds
+        self.map_timer.timeout.connect(self._refresh_live_map_if_dirty)
+        self.map_timer.start(500)
         
     def init_ui(self):
         """Initialize the user interface"""
@@ -110,7 +337,7 @@ class SecondDroneTab(QWidget):
         # Connect button
         self.connect_btn = QPushButton("🔌 Connect Drone 2")
         self.connect_btn.clicked.connect(self.toggle_connection)
-        self.connect_btn.setStyleSheet(self._button_style("#4a90e2"))
+        self.connect_btn.setStyleSheet(_button_style("#4a90e2"))
         conn_layout.addWidget(self.connect_btn, 1, 0, 1, 3)
         
         # Connection status
@@ -140,7 +367,7 @@ class SecondDroneTab(QWidget):
         # Generate from priority list
         gen_btn = QPushButton("🎯 Generate from Priority List")
         gen_btn.clicked.connect(self.generate_waypoints_from_priority)
-        gen_btn.setStyleSheet(self._button_style("#27ae60"))
+        gen_btn.setStyleSheet(_button_style("#27ae60"))
         waypoint_gen_layout.addWidget(gen_btn)
         
         # Add takeoff/RTL options
@@ -164,6 +391,11 @@ class SecondDroneTab(QWidget):
         
         self.waypoint_list = QListWidget()
         self.waypoint_list.setAlternatingRowColors(True)
+        # Every entry is the same two-line text, so skip per-item height
+        # measurement and lay out long lists in batches
+        self.waypoint_list.setUniformItemSizes(True)
+        self.waypoint_list.setLayoutMode(QListView.Batched)
+        self.waypoint_list.setBatchSize(100)
         self.waypoint_list.setStyleSheet("""
             QListWidget {
                 background-color: #1e1e1e;
@@ -180,12 +412,12 @@ class SecondDroneTab(QWidget):
         
         clear_wp_btn = QPushButton("🗑️ Clear")
         clear_wp_btn.clicked.connect(self.clear_waypoints)
-        clear_wp_btn.setStyleSheet(self._button_style("#e74c3c"))
+        clear_wp_btn.setStyleSheet(_button_style("#e74c3c"))
         wp_controls.addWidget(clear_wp_btn)
         
         upload_btn = QPushButton("🚀 Upload to Drone 2")
         upload_btn.clicked.connect(self.upload_mission)
-        upload_btn.setStyleSheet(self._button_style("#f39c12"))
+        upload_btn.setStyleSheet(_button_style("#f39c12"))
         wp_controls.addWidget(upload_btn)
         
         waypoint_list_layout.addLayout(wp_controls)
@@ -204,6 +436,7 @@ class SecondDroneTab(QWidget):
         # Telemetry group
         telemetry_group = QGroupBox("📊 Second Drone Telemetry")
         telemetry_layout = QGridLayout(telemetry_group)
+        self.telemetry_group = telemetry_group
         
         # Create telemetry labels
         labels = [
@@ -232,6 +465,23 @@ class SecondDroneTab(QWidget):
             
             self.telemetry_labels[key] = value
         
+        # (key, formatter, bound setText) per field, so update_telemetry does
+        # no per-tick dict lookups into telemetry_labels
+        formats = {
+            'lat': "{:.6f}°".format,
+            'lon': "{:.6f}°".format,
+            'alt': "{:.1f} m".format,
+            'pitch': "{:.1f}°".format,
+            'roll': "{:.1f}°".format,
+            'yaw': "{:.1f}°".format,
+            'battery': "{}%".format,
+            'mode': str,
+            'armed': lambda armed: "Yes" if armed else "No",
+        }
+        self._telemetry_writers = [
+            (key, formats[key], self.telemetry_labels[key].setText) for _, key in labels
+        ]
+        
         telemetry_group.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Maximum)
         layout.addWidget(telemetry_group, 0)
         
@@ -273,35 +523,27 @@ class SecondDroneTab(QWidget):
         
         return panel
     
-    def _button_style(self, color):
-        """Generate button stylesheet"""
-        return f"""
-            QPushButton {{
-                background-color: {color};
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {color}dd;
-            }}
-            QPushButton:pressed {{
-                background-color: {color}bb;
-            }}
-        """
-    
     def scan_ports(self):
-        """Scan for available COM ports"""
+        """Scan for available COM ports (Shift+click forces a fresh scan)"""
         import serial.tools.list_ports
         
-        ports = list(serial.tools.list_ports.comports())
-        self.port_combo.clear()
+        now = time.monotonic()
+        cached_at, ports = self._ports_cache
+        force = bool(QApplication.keyboardModifiers() & Qt.ShiftModifier)
+        if force or not ports or now - cached_at >= self._PORT_CACHE_TTL_S:
+            ports = [(port.device, port.description)
+                     for port in serial.tools.list_ports.comports()]
+            self._ports_cache = (now, ports)
+        
+        # Only repopulate the combo when the port set changed, so the
+        # user's current selection survives a rescan
+        entries = [f"{device} - {description}" for device, description in ports]
+        current = [self.port_combo.itemText(i) for i in range(self.port_combo.count())]
+        if entries != current:
+            self.port_combo.clear()
+            self.port_combo.addItems(entries)
         
         if ports:
-            for port in ports:
-                self.port_combo.addItem(f"{port.device} - {port.description}")
             self.log_status(f"Found {len(ports)} COM port(s)")
         else:
             self.log_status("No COM ports detected")
@@ -318,40 +560,35 @@ class SecondDroneTab(QWidget):
             
             port = port_text.split(" - ")[0]
             
-            # Create second MAVLink manager
-            from mavlink_manager import MavlinkManager
-            self.mavlink_manager_drone2 = MavlinkManager()
-            
-            success = self.mavlink_manager_drone2.connect(port)
+            success, message = self.mavlink_manager_drone2.connect(port)
             
             if success:
                 self.is_connected = True
                 self.conn_status_label.setText("🟢 Drone 2 Connected")
                 self.conn_status_label.setStyleSheet("color: #44ff44; font-weight: bold;")
                 self.connect_btn.setText("🔌 Disconnect Drone 2")
-                self.connect_btn.setStyleSheet(self._button_style("#e74c3c"))
+                self.connect_btn.setStyleSheet(_button_style("#e74c3c"))
                 self.log_status(f"✓ Connected to Drone 2 on {port}")
-                
-                # Connect telemetry updates
-                self.mavlink_manager_drone2.telemetry_updated.connect(self.update_telemetry)
             else:
                 QMessageBox.critical(self, "Connection Failed", 
-                                   f"Failed to connect to Drone 2 on {port}")
+                                   f"Failed to connect to Drone 2 on {port}\n\n{message}")
         else:
-            # Disconnect
-            if self.mavlink_manager_drone2:
-                self.mavlink_manager_drone2.disconnect()
-                self.mavlink_manager_drone2 = None
+            # Disconnect (the manager is kept for the next connection)
+            self.mavlink_manager_drone2.disconnect()
+            self._last_telemetry = self._last_flushed = None
             
-            # Clear telemetry display
+            # Clear telemetry display (one repaint for all labels)
+            self.telemetry_group.setUpdatesEnabled(False)
             for label in self.telemetry_labels.values():
                 label.setText("--")
+            self.telemetry_group.setUpdatesEnabled(True)
             
             self.is_connected = False
+            self._map_dirty = True  # Drop the Drone 2 marker from the map
             self.conn_status_label.setText("⚫ Not Connected")
             self.conn_status_label.setStyleSheet("color: #ff4444; font-weight: bold;")
             self.connect_btn.setText("🔌 Connect Drone 2")
-            self.connect_btn.setStyleSheet(self._button_style("#4a90e2"))
+            self.connect_btn.setStyleSheet(_button_style("#4a90e2"))
             self.log_status("✗ Disconnected from Drone 2")
     
     def update_mission_altitude(self, value):
@@ -373,36 +610,30 @@ class SecondDroneTab(QWidget):
                                   "No detected persons in priority list yet.")
             return
         
-        # Clear existing waypoints
-        self.rescue_waypoints.clear()
-        
-        # Generate waypoints from high-priority items
-        generated_count = 0
-        
-        for item in priority_items:
-            if item.gps_coords:
-                lat, lon = item.gps_coords
-                description = f"Person #{item.tracker_id} - {item.condition}"
-                
-                # Add waypoint
-                self.rescue_waypoints.append({
-                    'lat': lat,
-                    'lon': lon,
-                    'alt': self.mission_altitude,
-                    'description': description,
-                    'priority_score': item.priority_score,
-                    'condition': item.condition
-                })
-                generated_count += 1
+        # Collect items with GPS into column arrays
+        gps_items = [item for item in priority_items if item.gps_coords]
+        n = len(gps_items)
+        lats = np.fromiter((item.gps_coords[0] for item in gps_items), np.float64, n)
+        lons = np.fromiter((item.gps_coords[1] for item in gps_items), np.float64, n)
+        scores = np.fromiter((item.priority_score for item in gps_items), np.int32, n)
+        
+        # Highest priority first; stable so ties keep priority-list order
+        order = np.argsort(-scores, kind='stable')
+        ranked = [gps_items[k] for k in order.tolist()]
+        self._set_waypoint_arrays(
+            lats[order], lons[order],
+            np.full(n, self.mission_altitude, dtype=np.float32),
+            scores[order],
+            [f"Person #{item.tracker_id} - {item.condition}" for item in ranked],
+            [item.condition for item in ranked]
+        )
+        generated_count = n
         
         if generated_count == 0:
             QMessageBox.information(self, "No GPS Data", 
                                   "No GPS coordinates available in priority items.")
             return
         
-        # Sort by priority score (highest first)
-        self.rescue_waypoints.sort(key=lambda x: x['priority_score'], reverse=True)
-        
         # Update display
         self.update_waypoint_list()
         
@@ -411,44 +642,109 @@ class SecondDroneTab(QWidget):
                               f"Generated {generated_count} rescue waypoint(s)\n"
                               f"Sorted by priority (highest first)")
     
+    def _set_waypoint_arrays(self, lats, lons, alts, scores, descs, conditions):
+        """Replace the waypoint columns and rebuild the matching upload dicts"""
+        waypoints = [
+            {
+                'lat': lat,
+                'lon': lon,
+                'alt': alt,
+                'description': desc,
+                'priority_score': score,
+                'condition': condition
+            }
+            for lat, lon, alt, score, desc, condition in zip(
+                lats.tolist(), lons.tolist(), alts.tolist(), scores.tolist(),
+                descs, conditions
+            )
+        ]
+        # Map marker text is built once here (the index is the visiting
+        # order) rather than on every live-map render
+        popups = [f"WP{i}: {desc}<br>Alt: {alt:g}m"
+                  for i, (desc, alt) in enumerate(zip(descs, alts.tolist()), 1)]
+        tooltips = [f"Waypoint {i}" for i in range(1, len(descs) + 1)]
+        with self.waypoints_lock:
+            self._lats = lats
+            self._lons = lons
+            self._alts = alts
+            self._scores = scores
+            self._descs = descs
+            self._conditions = conditions
+            self._popups = popups
+            self._tooltips = tooltips
+            self.rescue_waypoints[:] = waypoints
+            self._waypoints_version += 1
+    
+    def _waypoint_snapshot(self):
+        """Return a _WaypointSnapshot of the current waypoint columns.
+        
+        The columns are replaced wholesale, never mutated, so the references
+        taken under the lock stay consistent after it is released.
+        """
+        with self.waypoints_lock:
+            return _WaypointSnapshot(
+                self._waypoints_version, self._lats, self._lons, self._alts,
+                self._scores, self._descs, self._conditions,
+                self._popups, self._tooltips
+            )
+    
     def update_waypoint_list(self):
         """Update waypoint list display"""
-        self.waypoint_list.clear()
+        # Rebuild the list with painting and signals suspended: one repaint
+        # for the whole batch instead of one per item
+        self.waypoint_list.setUpdatesEnabled(False)
+        self.waypoint_list.blockSignals(True)
+        wps = self._waypoint_snapshot()
+        lats, lons, alts, scores, descs, conditions = (
+            wps.lats, wps.lons, wps.alts, wps.scores, wps.descs, wps.conditions)
+        try:
+            self.waypoint_list.clear()
         
-        for i, wp in enumerate(self.rescue_waypoints, 1):
-            wp_text = (f"{i}. [{wp['priority_score']}] {wp['description']}\n"
-                      f"    GPS: {wp['lat']:.6f}, {wp['lon']:.6f} @ {wp['alt']}m")
+            rows = zip(scores.tolist(), descs, lats.tolist(),
+                       lons.tolist(), alts.tolist(), conditions)
+            for i, (score, desc, lat, lon, alt, condition) in enumerate(rows, 1):
+                wp_text = (f"{i}. [{score}] {desc}\n"
+                          f"    GPS: {lat:.6f}, {lon:.6f} @ {alt:g}m")
             
-            item = QListWidgetItem(wp_text)
+                item = QListWidgetItem(wp_text)
             
-            # Color code by condition
-            if wp['condition'] == 'Critical':
-                item.setForeground(QColor(255, 100, 100))
-            elif wp['condition'] == 'Warning':
-                item.setForeground(QColor(255, 180, 0))
-            else:
-                item.setForeground(QColor(100, 255, 100))
+                # Color code by condition
+                if condition == 'Critical':
+                    item.setForeground(QColor(255, 100, 100))
+                elif condition == 'Warning':
+                    item.setForeground(QColor(255, 180, 0))
+                else:
+                    item.setForeground(QColor(100, 255, 100))
             
-            self.waypoint_list.addItem(item)
+                self.waypoint_list.addItem(item)
+        finally:
+            self.waypoint_list.blockSignals(False)
+            self.waypoint_list.setUpdatesEnabled(True)
+            self.waypoint_list.viewport().update()
         
-        self.waypoint_count_label.setText(f"Waypoints: {len(self.rescue_waypoints)}")
+        self.waypoint_count_label.setText(f"Waypoints: {len(descs)}")
         
         # Update map
         self.update_live_map()
     
     def clear_waypoints(self):
         """Clear all waypoints"""
-        if not self.rescue_waypoints:
+        with self.waypoints_lock:
+            count = len(self.rescue_waypoints)
+        if not count:
             return
         
         reply = QMessageBox.question(
             self, "Clear Waypoints",
-            f"Clear all {len(self.rescue_waypoints)} waypoint(s)?",
+            f"Clear all {count} waypoint(s)?",
             QMessageBox.Yes | QMessageBox.No
         )
         
         if reply == QMessageBox.Yes:
-            self.rescue_waypoints.clear()
+            self._set_waypoint_arrays(
+                np.empty(0, np.float64), np.empty(0, np.float64),
+                np.empty(0, np.float32), np.empty(0, np.int32), [], []
+            )
             self.update_waypoint_list()
             self.log_status("✓ Cleared all waypoints")
     
@@ -459,7 +755,11 @@ class SecondDroneTab(QWidget):
                               "Please connect to Drone 2 first.")
             return
         
-        if not self.rescue_waypoints:
+        # Work on a copy so generation/clearing cannot change it mid-upload
+        with self.waypoints_lock:
+            waypoints = list(self.rescue_waypoints)
+        
+        if not waypoints:
             QMessageBox.warning(self, "No Waypoints", 
                               "No waypoints to upload. Generate waypoints first.")
             return
@@ -467,7 +767,7 @@ class SecondDroneTab(QWidget):
         # Confirm upload
         reply = QMessageBox.question(
             self, "Upload Mission",
-            f"Upload {len(self.rescue_waypoints)} rescue waypoint(s) to Drone 2?",
+            f"Upload {len(waypoints)} rescue waypoint(s) to Drone 2?",
             QMessageBox.Yes | QMessageBox.No
         )
         
@@ -478,8 +778,8 @@ class SecondDroneTab(QWidget):
         mission_waypoints = []
         
         # Add takeoff if requested
-        if self.add_takeoff_check.isChecked() and self.rescue_waypoints:
-            first_wp = self.rescue_waypoints[0]
+        if self.add_takeoff_check.isChecked() and waypoints:
+            first_wp = waypoints[0]
             mission_waypoints.append({
                 'command': 'TAKEOFF',
                 'lat': first_wp['lat'],
@@ -488,7 +788,7 @@ class SecondDroneTab(QWidget):
             })
         
         # Add rescue waypoints
-        for wp in self.rescue_waypoints:
+        for wp in waypoints:
             mission_waypoints.append({
                 'command': 'WAYPOINT',
                 'lat': wp['lat'],
@@ -504,6 +804,7 @@ class SecondDroneTab(QWidget):
         self.log_status(f"Uploading {len(mission_waypoints)} waypoint(s) to Drone 2...")
         
         try:
+            from mission_upload import upload_mission_to_drone
             success = upload_mission_to_drone(
                 self.mavlink_manager_drone2,
                 mission_waypoints
@@ -523,38 +824,89 @@ class SecondDroneTab(QWidget):
             QMessageBox.critical(self, "Upload Error", f"Error uploading mission:\n{str(e)}")
     
     def update_telemetry(self, telemetry):
-        """Update telemetry display for second drone"""
-        self.telemetry_labels['lat'].setText(f"{telemetry['lat']:.6f}°")
-        self.telemetry_labels['lon'].setText(f"{telemetry['lon']:.6f}°")
-        self.telemetry_labels['alt'].setText(f"{telemetry['alt']:.1f} m")
-        self.telemetry_labels['pitch'].setText(f"{telemetry['pitch']:.1f}°")
-        self.telemetry_labels['roll'].setText(f"{telemetry['roll']:.1f}°")
-        self.telemetry_labels['yaw'].setText(f"{telemetry['yaw']:.1f}°")
-        self.telemetry_labels['battery'].setText(f"{telemetry['battery']}%")
-        self.telemetry_labels['mode'].setText(telemetry['mode'])
-        self.telemetry_labels['armed'].setText("Yes" if telemetry['armed'] else "No")
+        """Record the latest telemetry; labels are written by _flush_telemetry"""
+        if not self.is_connected:
+            return  # Late queued update after disconnect; keep labels at "--"
+        self._last_telemetry = telemetry
+    
+    def _flush_telemetry(self):
+        """Write the newest telemetry to the labels (at most 10 times a second)"""
+        telemetry = self._last_telemetry
+        if telemetry is None or telemetry is self._last_flushed:
+            return
+        self._last_flushed = telemetry
+        for key, fmt, set_text in self._telemetry_writers:
+            set_text(fmt(telemetry[key]))
     
     def init_live_map(self):
-        """Initialize empty live map"""
-        m = folium.Map(location=[0, 0], zoom_start=2)
-        
-        html_path = os.path.join(os.path.dirname(__file__), 'temp_second_drone_map.html')
-        m.save(html_path)
-        self.live_map_view.setUrl(QUrl.fromLocalFile(html_path))
+        """Initialize live map page and hook drone updates to page loads"""
+        self.live_map_view.loadFinished.connect(self._on_live_map_loaded)
+        self._render_live_map(0.0, 0.0, 0.0, 0.0)
+    
+    def _on_telemetry_changed(self, _telemetry):
+        """Mark the live map stale; the map timer picks it up"""
+        self._map_dirty = True
+    
+    def _refresh_live_map_if_dirty(self):
+        """Refresh the live map only when telemetry arrived since last tick"""
+        if self._map_dirty:
+            self._map_dirty = False
+            self.update_live_map()
+    
+    def _on_live_map_loaded(self, ok):
+        """Push current drone positions into a freshly loaded map page"""
+        if ok:
+            self._last_map_key = None
+            self.update_live_map()
     
     def update_live_map(self):
         """Update live map with both drones and waypoints"""
-        # Get telemetry from first drone
-        telemetry1 = self.mavlink_manager_drone1.get_telemetry()
-        lat1 = telemetry1.get('lat', 0)
-        lon1 = telemetry1.get('lon', 0)
-        
-        # Get telemetry from second drone if connected
-        lat2, lon2 = 0, 0
+        # Snapshot both drones' telemetry into locals once per tick
+        t1 = self.mavlink_manager_drone1.get_telemetry() or {}
+        lat1 = t1.get('lat', 0.0)
+        lon1 = t1.get('lon', 0.0)
+        alt1 = t1.get('alt', 0.0)
+        
+        # Second drone only contributes while connected
+        t2 = {}
         if self.is_connected and self.mavlink_manager_drone2:
-            telemetry2 = self.mavlink_manager_drone2.get_telemetry()
-            lat2 = telemetry2.get('lat', 0)
-            lon2 = telemetry2.get('lon', 0)
+            t2 = self.mavlink_manager_drone2.get_telemetry() or {}
+        lat2 = t2.get('lat', 0.0)
+        lon2 = t2.get('lon', 0.0)
+        alt2 = t2.get('alt', 0.0)
+        
+        # The folium page is only regenerated when the waypoint set changes
+        # (and not for a version whose render has already been given up on)
+        version = self._waypoints_version
+        if self._rendered_waypoints_version != version and not (
+            version == self._failed_render_version
+            and self._render_failures >= self._MAX_RENDER_ATTEMPTS
+        ):
+            self._render_live_map(lat1, lon1, lat2, lon2)
+            return
+        
+        # Skip the JS round-trip entirely when nothing visible has changed
+        map_key = (round(lat1, 6), round(lon1, 6), round(lat2, 6), round(lon2, 6))
+        if map_key == self._last_map_key:
+            return
+        self._last_map_key = map_key
+        
+        # Move the drone markers in place instead of reloading the page
+        self.live_map_view.page().runJavaScript(
+            f"if (window.updateDrones) {{ updateDrones("
+            f"{lat1}, {lon1}, {alt1}, {lat2}, {lon2}, {alt2}); }}"
+        )
+    
+    def _render_live_map(self, lat1, lon1, lat2, lon2):
+        """Regenerate the folium page holding the waypoints and drone layer.
+        
+        Inputs are snapshotted here and the folium build runs on the thread
+        pool; the finished page is loaded in ``_on_live_map_rendered``.
+        """
+        if self._render_inflight:
+            return  # Picked up again once the running render finishes
+        
+        wps = self._waypoint_snapshot()
         
         # Determine map center
         if lat1 != 0 and lon1 != 0:
@@ -563,61 +915,67 @@ class SecondDroneTab(QWidget):
         elif lat2 != 0 and lon2 != 0:
             center_lat, center_lon = lat2, lon2
             zoom = 16
-        elif self.rescue_waypoints:
-            first_wp = self.rescue_waypoints[0]
-            center_lat, center_lon = first_wp['lat'], first_wp['lon']
+        elif wps.descs:
+            center_lat, center_lon = float(wps.lats[0]), float(wps.lons[0])
             zoom = 16
         else:
             center_lat, center_lon = 0, 0
             zoom = 2
         
-        # Create map
-        m = folium.Map(location=[center_lat, center_lon], zoom_start=zoom)
+        task = _MapRenderTask(wps.version, center_lat, center_lon, zoom,
+                              self._route_coords(wps), wps.popups, wps.tooltips)
+        task.signals.finished.connect(self._on_live_map_rendered)
+        self._render_inflight = True
+        self._render_task = task  # Keep the signals object alive until delivery
+        self._render_pool.start(task)
+    
+    def _route_coords(self, wps):
+        """Route as [[lon, lat], ...], rebuilt only when the waypoints change"""
+        if self._route_cache_version != wps.version:
+            self._route_cache = np.column_stack((wps.lons, wps.lats)).tolist()
+            self._route_cache_version = wps.version
+        return self._route_cache
+    
+    def _on_live_map_rendered(self, version, html, error):
+        """Load a page produced by _MapRenderTask (runs on the GUI thread)"""
+        self._render_inflight = False
+        self._render_task = None
+        
+        if not html:
+            # Render failed: leave the version unrendered and retry on the
+            # next tick, up to _MAX_RENDER_ATTEMPTS per waypoint version
+            if version != self._failed_render_version:
+                self._failed_render_version = version
+                self._render_failures = 0
+            self._render_failures += 1
+            if self._render_failures < self._MAX_RENDER_ATTEMPTS:
+                self._map_dirty = True
+            elif self._render_failures == self._MAX_RENDER_ATTEMPTS:
+                # Report once; the map stays as-is until the waypoints change
+                print(f"Live map render failed: {error}")
+                self.log_status(f"✗ Live map render failed: {error}")
+            if version != self._waypoints_version:
+                self._map_dirty = True
+            return
+        
+        self._rendered_waypoints_version = version
+        self._last_map_key = None
         
-        # Add first drone marker (red)
-        if lat1 != 0 and lon1 != 0:
-            folium.Marker(
-                [lat1, lon1],
-                popup=f"Drone 1 (Surveillance)<br>Alt: {telemetry1['alt']:.1f}m",
-                tooltip="Drone 1",
-                icon=folium.Icon(color='red', icon='plane', prefix='fa')
-            ).add_to(m)
-        
-        # Add second drone marker (green)
-        if lat2 != 0 and lon2 != 0:
-            folium.Marker(
-                [lat2, lon2],
-                popup=f"Drone 2 (Rescue)<br>Alt: {telemetry2['alt']:.1f}m",
-                tooltip="Drone 2",
-                icon=folium.Icon(color='green', icon='helicopter', prefix='fa')
-            ).add_to(m)
-        
-        # Add rescue waypoints (orange markers)
-        for i, wp in enumerate(self.rescue_waypoints, 1):
-            folium.Marker(
-                [wp['lat'], wp['lon']],
-                popup=f"WP{i}: {wp['description']}<br>Alt: {wp['alt']}m",
-                tooltip=f"Waypoint {i}",
-                icon=folium.Icon(color='orange', icon='user', prefix='fa')
-            ).add_to(m)
-        
-        # Draw route line between waypoints
-        if self.rescue_waypoints:
-            route_coords = [[wp['lat'], wp['lon']] for wp in self.rescue_waypoints]
-            folium.PolyLine(
-                route_coords,
-                color='orange',
-                weight=3,
-                opacity=0.7,
-                popup='Rescue Route'
-            ).add_to(m)
-        
-        # Save and load map
-        html_path = os.path.join(os.path.dirname(__file__), 'temp_second_drone_map.html')
-        m.save(html_path)
-        self.live_map_view.setUrl(QUrl.fromLocalFile(html_path))
+        # Hand the rendered page straight to the view; no temp file round-trip
+        base_url = QUrl.fromLocalFile(os.path.dirname(os.path.abspath(__file__)) + os.sep)
+        self.live_map_view.setHtml(html, base_url)
+        
+        # Waypoints changed while rendering: render again on the next tick
+        if version != self._waypoints_version:
+            self._map_dirty = True
     
     def log_status(self, message):
-        """Log message to mission status"""
+        """Queue message for the mission status log"""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.mission_status.append(f"[{timestamp}] {message}")
+        self._log_buffer.append(f"[{timestamp}] {message}")
+    
+    def _flush_log(self):
+        """Append all queued status lines to the log view in one layout pass"""
+        if self._log_buffer:
+            self.mission_status.append("\n".join(self._log_buffer))
+            self._log_buffer.clear()
@@ -2,23 +2,161 @@
 Telemetry Tab - Real-time drone telemetry display
 """
 
+import time
+from operator import itemgetter
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QGroupBox, QGridLayout, QPushButton, QSizePolicy)
-from PyQt5.QtCore import Qt, pyqtSlot
+from PyQt5.QtCore import Qt, QTimer, pyqtSlot
 from PyQt5.QtGui import QFont
 
 
+# Static label styles, selected by objectName or the "role" property
+LABEL_QSS = """
+QLabel#telemetryTitle {
+    font-size: 20pt;
+    font-weight: bold;
+    color: #4a90e2;
+    padding: 10px;
+}
+
+QLabel#telemetryHint {
+    color: #888;
+    font-size: 10pt;
+    padding: 10px;
+}
+
+QLabel[role="name"] {
+    font-weight: bold;
+    font-size: 11pt;
+}
+
+QLabel#connectionLabel {
+    font-size: 14pt;
+    font-weight: bold;
+    color: #ff4444;
+    padding: 5px;
+}
+
+QLabel#connectionLabel[state="up"] {
+    color: #44ff44;
+}
+"""
+
+# Value labels; the colour-coded ones switch rules via their "state" property
+VALUE_QSS = """
+QLabel[role="value"] {
+    font-size: 12pt;
+    color: #4a90e2;
+}
+
+QLabel#batteryValue[state="hi"] { color: #44ff44; }
+QLabel#batteryValue[state="mid"] { color: #ffaa00; }
+QLabel#batteryValue[state="lo"] { color: #ff4444; }
+
+QLabel#armedValue { color: #888; }
+QLabel#armedValue[state="armed"] { color: #ff4444; font-weight: bold; }
+QLabel#armedValue[state="disarmed"] { color: #44ff44; }
+"""
+
+TELEMETRY_QSS = """
+QWidget {
+    background-color: #2b2b2b;
+    color: #ffffff;
+}
+
+QGroupBox {
+    border: 2px solid #3d3d3d;
+    border-radius: 8px;
+    margin-top: 15px;
+    padding: 15px;
+    font-weight: bold;
+    font-size: 12pt;
+    color: #4a90e2;
+}
+
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 15px;
+    padding: 0 8px;
+}
+""" + LABEL_QSS + VALUE_QSS
+
+
+def _name_label(text):
+    """Bold field-name label"""
+    label = QLabel(text)
+    label.setProperty("role", "name")
+    return label
+
+
+def _value_label(object_name=None):
+    """Right-aligned value label showing "--" until data arrives"""
+    value = QLabel("--")
+    value.setProperty("role", "value")
+    if object_name:
+        value.setObjectName(object_name)
+    value.setAlignment(Qt.AlignRight)
+    return value
+
+
 class TelemetryTab(QWidget):
     """Tab for displaying real-time drone telemetry"""
     
+    # Pre-bound %-formatters for the numeric fields
+    _FMT_COORD = "%.7f°".__mod__
+    _FMT_ALT = "%.2f m".__mod__
+    _FMT_ANGLE = "%.2f°".__mod__
+    _FMT_VOLTAGE = "%.2f V".__mod__
+    _FMT_CURRENT = "%.1f A".__mod__
+    
+    # Minimum seconds between redraws of each label group. Each group draws
+    # a new frame at most once; attitude and mode/armed draw it on the next
+    # flush (10 Hz), and mode/armed labels are only written when they change
+    _GROUP_INTERVAL_S = {'att': 0.0, 'pos': 0.25, 'sys': 1.0, 'flight': 0.0}
+    
+    # One C-level fetch per label group (MavlinkManager always emits the
+    # full telemetry dict, so every key is present)
+    _POS_FIELDS = itemgetter('lat', 'lon', 'alt')
+    _ATT_FIELDS = itemgetter('pitch', 'roll', 'yaw')
+    _SYS_FIELDS = itemgetter('battery', 'voltage', 'current')
+    _FLIGHT_FIELDS = itemgetter('mode', 'armed')
+    
     def __init__(self, mavlink_manager):
         super().__init__()
         self.mavlink_manager = mavlink_manager
+        
+        # Last text / style state written per label key, so unchanged
+        # values skip setText and the repolish a state change costs
+        self._last_text = {}
+        self._last_style = {'connection': 'down'}
+        
         self.init_ui()
         self.apply_stylesheet()
         
-        # Connect to telemetry updates
-        self.mavlink_manager.telemetry_updated.connect(self.update_telemetry)
+        # Latest telemetry not yet shown; drained into the labels at most
+        # every 100 ms so bursts from the MAVLink thread don't flood the GUI.
+        # The timer only runs while the tab is visible (see showEvent)
+        self._pending = None
+        self._owed = set()  # Groups that have not drawn _pending yet
+        self._pending_connected = None  # Status change received while hidden
+        # Frames are queued from the reader thread, so one can arrive after
+        # the disconnect reset; ignore telemetry while not connected
+        self._connected = bool(getattr(mavlink_manager, 'connected', False))
+        self._last_group_flush = dict.fromkeys(self._GROUP_INTERVAL_S, float('-inf'))
+        self._groups = (
+            ('att', self._show_attitude),
+            ('pos', self._show_position),
+            ('sys', self._show_system),
+            ('flight', self._show_flight),
+        )
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(100)
+        self._flush_timer.timeout.connect(self._flush)
+        
+        # Connect to telemetry updates. telemetry_updated is emitted from the
+        # MAVLink reader thread; queue it explicitly so the slot always runs
+        # on the GUI thread and the reader never waits on widget work
+        self.mavlink_manager.telemetry_updated.connect(self.update_telemetry, Qt.QueuedConnection)
         self.mavlink_manager.connection_status_changed.connect(self.update_connection_status)
         
     def init_ui(self):
@@ -28,14 +166,15 @@ class TelemetryTab(QWidget):
         
         # Title
         title = QLabel("Live Telemetry Data")
-        title.setStyleSheet("font-size: 20pt; font-weight: bold; color: #4a90e2; padding: 10px;")
+        title.setObjectName("telemetryTitle")
         title.setAlignment(Qt.AlignCenter)
         title.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
         layout.addWidget(title)
         
         # Connection status
         self.connection_label = QLabel("● NOT CONNECTED")
-        self.connection_label.setStyleSheet("font-size: 14pt; font-weight: bold; color: #ff4444; padding: 5px;")
+        self.connection_label.setObjectName("connectionLabel")
+        self.connection_label.setProperty("state", "down")
         self.connection_label.setAlignment(Qt.AlignCenter)
         self.connection_label.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
         layout.addWidget(self.connection_label)
@@ -64,7 +203,7 @@ class TelemetryTab(QWidget):
         instructions = QLabel(
             "Connect to your drone via the Mission Planner tab to view live telemetry data"
         )
-        instructions.setStyleSheet("color: #888; font-size: 10pt; padding: 10px;")
+        instructions.setObjectName("telemetryHint")
         instructions.setAlignment(Qt.AlignCenter)
         instructions.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
         layout.addWidget(instructions)
@@ -84,11 +223,8 @@ class TelemetryTab(QWidget):
         
         self.gps_labels = {}
         for row, (label_text, key) in enumerate(labels):
-            label = QLabel(label_text)
-            label.setStyleSheet("font-weight: bold; font-size: 11pt;")
-            value = QLabel("--")
-            value.setStyleSheet("font-size: 12pt; color: #4a90e2;")
-            value.setAlignment(Qt.AlignRight)
+            label = _name_label(label_text)
+            value = _value_label()
             
             layout.addWidget(label, row, 0)
             layout.addWidget(value, row, 1)
@@ -110,11 +246,8 @@ class TelemetryTab(QWidget):
         
         self.attitude_labels = {}
         for row, (label_text, key) in enumerate(labels):
-            label = QLabel(label_text)
-            label.setStyleSheet("font-weight: bold; font-size: 11pt;")
-            value = QLabel("--")
-            value.setStyleSheet("font-size: 12pt; color: #4a90e2;")
-            value.setAlignment(Qt.AlignRight)
+            label = _name_label(label_text)
+            value = _value_label()
             
             layout.addWidget(label, row, 0)
             layout.addWidget(value, row, 1)
@@ -128,32 +261,33 @@ class TelemetryTab(QWidget):
         layout = QGridLayout(group)
         layout.setSpacing(10)
         
-        # Battery
-        battery_label = QLabel("Battery:")
-        battery_label.setStyleSheet("font-weight: bold; font-size: 11pt;")
-        self.battery_value = QLabel("--")
-        self.battery_value.setStyleSheet("font-size: 12pt; color: #4a90e2;")
-        self.battery_value.setAlignment(Qt.AlignRight)
+        # Battery: the number (written with setNum) and a static "%" suffix
+        # sit side by side; both carry the colour state
+        battery_label = _name_label("Battery:")
+        self.battery_num = _value_label("batteryValue")
+        self.battery_suffix = _value_label("batteryValue")
+        self.battery_suffix.setText("%")
+        self.battery_suffix.hide()  # Shown with the first reading
+        
+        battery_layout = QHBoxLayout()
+        battery_layout.setSpacing(0)
+        battery_layout.addStretch()
+        battery_layout.addWidget(self.battery_num)
+        battery_layout.addWidget(self.battery_suffix)
         
         layout.addWidget(battery_label, 0, 0)
-        layout.addWidget(self.battery_value, 0, 1)
+        layout.addLayout(battery_layout, 0, 1)
         
         # Voltage
-        voltage_label = QLabel("Voltage:")
-        voltage_label.setStyleSheet("font-weight: bold; font-size: 11pt;")
-        self.voltage_value = QLabel("--")
-        self.voltage_value.setStyleSheet("font-size: 12pt; color: #4a90e2;")
-        self.voltage_value.setAlignment(Qt.AlignRight)
+        voltage_label = _name_label("Voltage:")
+        self.voltage_value = _value_label()
         
         layout.addWidget(voltage_label, 1, 0)
         layout.addWidget(self.voltage_value, 1, 1)
         
         # Current
-        current_label = QLabel("Current:")
-        current_label.setStyleSheet("font-weight: bold; font-size: 11pt;")
-        self.current_value = QLabel("--")
-        self.current_value.setStyleSheet("font-size: 12pt; color: #4a90e2;")
-        self.current_value.setAlignment(Qt.AlignRight)
+        current_label = _name_label("Current:")
+        self.current_value = _value_label()
         
         layout.addWidget(current_label, 2, 0)
         layout.addWidget(self.current_value, 2, 1)
@@ -167,21 +301,15 @@ class TelemetryTab(QWidget):
         layout.setSpacing(10)
         
         # Flight Mode
-        mode_label = QLabel("Flight Mode:")
-        mode_label.setStyleSheet("font-weight: bold; font-size: 11pt;")
-        self.mode_value = QLabel("--")
-        self.mode_value.setStyleSheet("font-size: 12pt; color: #4a90e2;")
-        self.mode_value.setAlignment(Qt.AlignRight)
+        mode_label = _name_label("Flight Mode:")
+        self.mode_value = _value_label()
         
         layout.addWidget(mode_label, 0, 0)
         layout.addWidget(self.mode_value, 0, 1)
         
         # Armed Status
-        armed_label = QLabel("Armed:")
-        armed_label.setStyleSheet("font-weight: bold; font-size: 11pt;")
-        self.armed_value = QLabel("--")
-        self.armed_value.setStyleSheet("font-size: 12pt; color: #888;")
-        self.armed_value.setAlignment(Qt.AlignRight)
+        armed_label = _name_label("Armed:")
+        self.armed_value = _value_label("armedValue")
         
         layout.addWidget(armed_label, 1, 0)
         layout.addWidget(self.armed_value, 1, 1)
@@ -190,90 +318,171 @@ class TelemetryTab(QWidget):
     
     @pyqtSlot(dict)
     def update_telemetry(self, telemetry):
-        """Update telemetry display with new data"""
-        # GPS & Position
-        self.gps_labels['lat'].setText(f"{telemetry['lat']:.7f}°")
-        self.gps_labels['lon'].setText(f"{telemetry['lon']:.7f}°")
-        self.gps_labels['alt'].setText(f"{telemetry['alt']:.2f} m")
-        
-        # Attitude
-        self.attitude_labels['pitch'].setText(f"{telemetry['pitch']:.2f}°")
-        self.attitude_labels['roll'].setText(f"{telemetry['roll']:.2f}°")
-        self.attitude_labels['yaw'].setText(f"{telemetry['yaw']:.2f}°")
+        """Queue new telemetry for the next display flush.
+        
+        Only stores the frame and marks every group as owing a redraw; all
+        widget access happens in _flush on the GUI thread.
+        """
+        if self._connected:
+            self._pending = telemetry
+            self._owed = set(self._GROUP_INTERVAL_S)
+    
+    def showEvent(self, event):
+        """Catch up on anything received while hidden, then resume flushing"""
+        super().showEvent(event)
+        connected = self._pending_connected
+        if connected is not None:
+            self._pending_connected = None
+            self._apply_connection_status(connected)
+        self._reset_group_cadence()  # Show every group straight away
+        self._flush()
+        self._flush_timer.start()
+    
+    def hideEvent(self, event):
+        """No label updates while another tab is showing"""
+        super().hideEvent(event)
+        self._flush_timer.stop()
+    
+    def _set_text(self, label, key, text):
+        """setText only when the text differs from what ``key`` last showed"""
+        if self._last_text.get(key) != text:
+            self._last_text[key] = text
+            label.setText(text)
+    
+    def _set_num(self, label, key, num):
+        """setNum counterpart of _set_text for integer fields"""
+        if self._last_text.get(key) != num:
+            self._last_text[key] = num
+            label.setNum(num)
+    
+    def _set_style(self, key, state, *labels):
+        """Switch the labels' QSS "state" property, repolishing only on change"""
+        if self._last_style.get(key) != state:
+            self._last_style[key] = state
+            for label in labels:
+                label.setProperty("state", state)
+                style = label.style()
+                style.unpolish(label)
+                style.polish(label)
+    
+    def _reset_group_cadence(self):
+        """Make every label group due on the next flush"""
+        self._last_group_flush = dict.fromkeys(self._GROUP_INTERVAL_S, float('-inf'))
+    
+    def _flush(self):
+        """Update telemetry display with the latest queued data.
+        
+        Each label group draws a frame once, when its cadence allows; the
+        frame stays queued only until every group that still owes it has
+        drawn it.
+        """
+        telemetry = self._pending
+        if telemetry is None:
+            return
+        
+        now = time.monotonic()
+        last = self._last_group_flush
+        intervals = self._GROUP_INTERVAL_S
+        owed = self._owed
+        for group, show in self._groups:
+            if group in owed and now - last[group] >= intervals[group]:
+                last[group] = now
+                show(telemetry)
+                owed.discard(group)
+        
+        if not owed:
+            self._pending = None
+    
+    def _show_position(self, telemetry):
+        """GPS & Position labels"""
+        lat, lon, alt = self._POS_FIELDS(telemetry)
+        set_text = self._set_text
+        fmt_coord = self._FMT_COORD
+        set_text(self.gps_labels['lat'], 'lat', fmt_coord(lat))
+        set_text(self.gps_labels['lon'], 'lon', fmt_coord(lon))
+        set_text(self.gps_labels['alt'], 'alt', self._FMT_ALT(alt))
+    
+    def _show_attitude(self, telemetry):
+        """Attitude labels"""
+        pitch, roll, yaw = self._ATT_FIELDS(telemetry)
+        set_text = self._set_text
+        fmt_angle = self._FMT_ANGLE
+        set_text(self.attitude_labels['pitch'], 'pitch', fmt_angle(pitch))
+        set_text(self.attitude_labels['roll'], 'roll', fmt_angle(roll))
+        set_text(self.attitude_labels['yaw'], 'yaw', fmt_angle(yaw))
+    
+    def _show_system(self, telemetry):
+        """Battery, voltage and current labels"""
+        battery_pct, voltage, current = self._SYS_FIELDS(telemetry)
         
         # Battery
-        battery_pct = telemetry['battery']
-        self.battery_value.setText(f"{battery_pct}%")
+        self._set_num(self.battery_num, 'battery', int(battery_pct))
+        self.battery_suffix.setVisible(True)
         
         # Color code battery
+        battery_labels = (self.battery_num, self.battery_suffix)
         if battery_pct > 50:
-            self.battery_value.setStyleSheet("font-size: 12pt; color: #44ff44;")
+            self._set_style('battery', 'hi', *battery_labels)
         elif battery_pct > 20:
-            self.battery_value.setStyleSheet("font-size: 12pt; color: #ffaa00;")
+            self._set_style('battery', 'mid', *battery_labels)
         else:
-            self.battery_value.setStyleSheet("font-size: 12pt; color: #ff4444;")
+            self._set_style('battery', 'lo', *battery_labels)
         
         # Voltage
-        voltage = telemetry.get('voltage', 0.0)
-        self.voltage_value.setText(f"{voltage:.2f} V")
+        self._set_text(self.voltage_value, 'voltage', self._FMT_VOLTAGE(voltage))
         
         # Current
-        current = telemetry.get('current', 0.0)
-        self.current_value.setText(f"{current:.1f} A")
+        self._set_text(self.current_value, 'current', self._FMT_CURRENT(current))
+    
+    def _show_flight(self, telemetry):
+        """Flight mode and armed labels (change-only through the text cache)"""
+        mode, armed = self._FLIGHT_FIELDS(telemetry)
+        set_text = self._set_text
         
         # Flight Mode
-        self.mode_value.setText(telemetry['mode'])
+        set_text(self.mode_value, 'mode', mode)
         
         # Armed Status
-        if telemetry['armed']:
-            self.armed_value.setText("ARMED")
-            self.armed_value.setStyleSheet("font-size: 12pt; color: #ff4444; font-weight: bold;")
+        if armed:
+            set_text(self.armed_value, 'armed', "ARMED")
+            self._set_style('armed', 'armed', self.armed_value)
         else:
-            self.armed_value.setText("DISARMED")
-            self.armed_value.setStyleSheet("font-size: 12pt; color: #44ff44;")
+            set_text(self.armed_value, 'armed', "DISARMED")
+            self._set_style('armed', 'disarmed', self.armed_value)
     
     @pyqtSlot(bool)
     def update_connection_status(self, connected):
-        """Update connection status display"""
+        """Update connection status display (deferred while hidden)"""
+        self._connected = connected
+        if not connected:
+            # Drop any queued frame so it can't overwrite the reset
+            self._pending = None
+            self._owed.clear()
+        
+        if not self.isVisible():
+            self._pending_connected = connected
+            return
+        self._apply_connection_status(connected)
+    
+    def _apply_connection_status(self, connected):
+        """Show the connection banner; on disconnect reset all values"""
         if connected:
-            self.connection_label.setText("● CONNECTED")
-            self.connection_label.setStyleSheet("font-size: 14pt; font-weight: bold; color: #44ff44; padding: 5px;")
+            self._set_text(self.connection_label, 'connection', "● CONNECTED")
+            self._set_style('connection', 'up', self.connection_label)
         else:
-            self.connection_label.setText("● NOT CONNECTED")
-            self.connection_label.setStyleSheet("font-size: 14pt; font-weight: bold; color: #ff4444; padding: 5px;")
+            self._set_text(self.connection_label, 'connection', "● NOT CONNECTED")
+            self._set_style('connection', 'down', self.connection_label)
             
             # Reset all values to "--"
-            for label in self.gps_labels.values():
-                label.setText("--")
-            for label in self.attitude_labels.values():
-                label.setText("--")
-            self.battery_value.setText("--")
-            self.voltage_value.setText("--")
-            self.current_value.setText("--")
-            self.mode_value.setText("--")
-            self.armed_value.setText("--")
+            labels = {**self.gps_labels, **self.attitude_labels,
+                      'battery': self.battery_num, 'voltage': self.voltage_value,
+                      'current': self.current_value, 'mode': self.mode_value,
+                      'armed': self.armed_value}
+            for key, label in labels.items():
+                self._set_text(label, key, "--")
+            self.battery_suffix.hide()
+            self._reset_group_cadence()
     
     def apply_stylesheet(self):
         """Apply stylesheet to tab"""
-        self.setStyleSheet("""
-        QWidget {
-            background-color: #2b2b2b;
-            color: #ffffff;
-        }
-        
-        QGroupBox {
-            border: 2px solid #3d3d3d;
-            border-radius: 8px;
-            margin-top: 15px;
-            padding: 15px;
-            font-weight: bold;
-            font-size: 12pt;
-            color: #4a90e2;
-        }
-        
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 15px;
-            padding: 0 8px;
-        }
-        """)
+        self.setStyleSheet(TELEMETRY_QSS)
@@ -3,13 +3,35 @@ Utility Functions - Helper functions for validation, conversion, and common oper
 """
 
 import math
-import glob
 import os
 import time
+import operator
+from collections import deque
 from typing import Tuple, List, Dict
+import numpy as np
 import config
 
 
+# Defaults from config, bound once at import (call reload_config() after
+# changing config values at runtime)
+_MIN_BATTERY_PERCENT = config.MIN_BATTERY_PERCENT
+_MIN_ALTITUDE_M = config.MIN_ALTITUDE_M
+_MAX_ALTITUDE_M = config.MAX_ALTITUDE_M
+_MAX_SNAPSHOT_AGE_DAYS = config.MAX_SNAPSHOT_AGE_DAYS
+_MAX_SNAPSHOTS = config.MAX_SNAPSHOTS
+
+
+def reload_config():
+    """Re-read the config defaults used by the helpers in this module"""
+    global _MIN_BATTERY_PERCENT, _MIN_ALTITUDE_M, _MAX_ALTITUDE_M
+    global _MAX_SNAPSHOT_AGE_DAYS, _MAX_SNAPSHOTS
+    _MIN_BATTERY_PERCENT = config.MIN_BATTERY_PERCENT
+    _MIN_ALTITUDE_M = config.MIN_ALTITUDE_M
+    _MAX_ALTITUDE_M = config.MAX_ALTITUDE_M
+    _MAX_SNAPSHOT_AGE_DAYS = config.MAX_SNAPSHOT_AGE_DAYS
+    _MAX_SNAPSHOTS = config.MAX_SNAPSHOTS
+
+
 def is_valid_gps(lat: float, lon: float) -> bool:
     """
     Validate GPS coordinates
@@ -24,6 +46,23 @@ def is_valid_gps(lat: float, lon: float) -> bool:
     return (-90 <= lat <= 90) and (-180 <= lon <= 180)
 
 
+def _gps_valid_batch(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """
+    Vectorized is_valid_gps
+    
+    Args:
+        lats, lons: Arrays of coordinates in degrees
+        
+    Returns:
+        Boolean array, True where the coordinate pair is valid
+    """
+    return (np.abs(lats) <= 90) & (np.abs(lons) <= 180)
+
+
+# Metres per degree of latitude, on the same sphere as haversine_distance
+_M_PER_DEG = 6371000 * math.pi / 180
+
+
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
     Calculate distance between two GPS coordinates using Haversine formula
@@ -50,6 +89,30 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     return R * c
 
 
+def _haversine_batch(lat0: float, lon0: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """
+    Vectorized haversine distance from one point to many
+    
+    Args:
+        lat0, lon0: Reference point coordinates
+        lats, lons: Arrays of point coordinates
+        
+    Returns:
+        Array of distances in meters
+    """
+    R = 6371000  # Earth radius in meters
+    
+    lat0_rad = np.radians(lat0)
+    lats_rad = np.radians(lats)
+    delta_lat = lats_rad - lat0_rad
+    delta_lon = np.radians(lons - lon0)
+    
+    a = (np.sin(delta_lat / 2) ** 2 +
+         np.cos(lat0_rad) * np.cos(lats_rad) *
+         np.sin(delta_lon / 2) ** 2)
+    return 2 * R * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
 def check_battery_sufficient(telemetry: dict, min_battery: int = None) -> Tuple[bool, str]:
     """
     Check if battery is sufficient for mission
@@ -62,7 +125,7 @@ def check_battery_sufficient(telemetry: dict, min_battery: int = None) -> Tuple[
         (is_sufficient, message)
     """
     if min_battery is None:
-        min_battery = config.MIN_BATTERY_PERCENT
+        min_battery = _MIN_BATTERY_PERCENT
     
     battery = telemetry.get('battery', 0)
     
@@ -85,9 +148,9 @@ def validate_altitude(altitude: float, min_alt: float = None, max_alt: float = N
         (is_valid, message)
     """
     if min_alt is None:
-        min_alt = config.MIN_ALTITUDE_M
+        min_alt = _MIN_ALTITUDE_M
     if max_alt is None:
-        max_alt = config.MAX_ALTITUDE_M
+        max_alt = _MAX_ALTITUDE_M
     
     if altitude < min_alt:
         return False, f"Altitude too low: {altitude}m (minimum: {min_alt}m)"
@@ -111,30 +174,45 @@ def cleanup_old_snapshots(snapshot_dir: str, max_age_days: int = None, max_count
         return
     
     if max_age_days is None:
-        max_age_days = config.MAX_SNAPSHOT_AGE_DAYS
+        max_age_days = _MAX_SNAPSHOT_AGE_DAYS
     if max_count is None:
-        max_count = config.MAX_SNAPSHOTS
-    
-    pattern = os.path.join(snapshot_dir, "*.jpg")
-    files = glob.glob(pattern)
+        max_count = _MAX_SNAPSHOTS
+    
+    # One directory pass; each entry is stat'ed once and its mtime reused.
+    # Same selection as glob "*.jpg": dotfiles are skipped, and normcase
+    # makes the extension match case-insensitive on Windows as glob does
+    snapshots = []
+    with os.scandir(snapshot_dir) as it:
+        for entry in it:
+            name = entry.name
+            if not os.path.normcase(name).endswith('.jpg') or name.startswith('.'):
+                continue
+            try:
+                if entry.is_file():
+                    snapshots.append((entry.stat().st_mtime, entry.path))
+            except OSError:
+                continue
     
     # Remove by age
-    current_time = time.time()
+    current_time = time.time()  # Wall clock on purpose: compared with file mtimes
+    max_age_s = max_age_days * 86400
     removed_by_age = 0
-    for file in files:
-        try:
-            if (current_time - os.path.getmtime(file)) > (max_age_days * 86400):
+    files = []  # (mtime, path) still on disk
+    for mtime, file in snapshots:
+        if (current_time - mtime) > max_age_s:
+            try:
                 os.remove(file)
                 removed_by_age += 1
-        except Exception as e:
-            print(f"Failed to remove {file}: {e}")
+                continue
+            except Exception as e:
+                print(f"Failed to remove {file}: {e}")
+        files.append((mtime, file))
     
     # Remove by count
-    files = glob.glob(pattern)  # Refresh list
-    files = sorted(files, key=os.path.getmtime)
+    files.sort()
     removed_by_count = 0
     if len(files) > max_count:
-        for file in files[:-max_count]:
+        for _, file in files[:-max_count]:
             try:
                 os.remove(file)
                 removed_by_count += 1
@@ -148,6 +226,8 @@ def cleanup_old_snapshots(snapshot_dir: str, max_age_days: int = None, max_count
 class Geofence:
     """Geofence for validating waypoints are within allowed area"""
     
+    __slots__ = ('center', 'radius', '_cos_lat0', '_r_lo', '_r_hi')
+    
     def __init__(self, center_lat: float, center_lon: float, radius_meters: float):
         """
         Initialize geofence
@@ -159,6 +239,18 @@ class Geofence:
         """
         self.center = (center_lat, center_lon)
         self.radius = radius_meters
+        
+        # Equirectangular pre-filter for is_within: within 0.9*radius is
+        # inside and beyond 1.1*radius is outside without any trig. Only
+        # trusted where the flat approximation is good to well under 10%
+        # (fence up to 50 km, centre not within 10 deg of a pole)
+        self._cos_lat0 = math.cos(math.radians(center_lat))
+        if radius_meters <= 50000 and abs(center_lat) <= 80:
+            self._r_lo = (0.9 * radius_meters) ** 2
+            self._r_hi = (1.1 * radius_meters) ** 2
+        else:
+            self._r_lo = -1.0           # Never accept early
+            self._r_hi = float('inf')   # Never reject early
     
     def is_within(self, lat: float, lon: float) -> bool:
         """
@@ -169,11 +261,22 @@ class Geofence:
             lon: Point longitude
             
         Returns:
-            True if within geofence, False otherwise
+            True if within geofence, False otherwise (including for
+            points that are not valid GPS coordinates)
         """
-        distance = haversine_distance(
-            self.center[0], self.center[1], lat, lon
-        )
+        if not is_valid_gps(lat, lon):
+            return False
+        
+        center_lat, center_lon = self.center
+        dx = ((lon - center_lon + 180) % 360 - 180) * _M_PER_DEG * self._cos_lat0
+        dy = (lat - center_lat) * _M_PER_DEG
+        d2 = dx * dx + dy * dy
+        if d2 < self._r_lo:
+            return True
+        if d2 > self._r_hi:
+            return False
+        
+        distance = haversine_distance(center_lat, center_lon, lat, lon)
         return distance <= self.radius
     
     def validate_waypoints(self, waypoints: List[Dict]) -> Tuple[bool, str]:
@@ -186,16 +289,33 @@ class Geofence:
         Returns:
             (all_valid, message)
         """
-        for i, wp in enumerate(waypoints):
-            lat = wp.get('lat', 0)
-            lon = wp.get('lon', 0)
-            
-            if not self.is_within(lat, lon):
-                return False, f"Waypoint {i+1} outside geofence: ({lat:.6f}, {lon:.6f})"
+        n = len(waypoints)
+        lats = np.fromiter((wp.get('lat', 0) for wp in waypoints), dtype=np.float64, count=n)
+        lons = np.fromiter((wp.get('lon', 0) for wp in waypoints), dtype=np.float64, count=n)
+        
+        # Same test as is_within: invalid GPS coordinates are rejected
+        # first, then anything beyond the radius (NaN distances count as
+        # outside). The first offending waypoint is reported.
+        invalid = ~_gps_valid_batch(lats, lons)
+        inside = _haversine_batch(self.center[0], self.center[1], lats, lons) <= self.radius
+        rejected = invalid | ~inside
+        if rejected.any():
+            i = int(np.argmax(rejected))
+            if invalid[i]:
+                return False, f"Waypoint {i+1} has invalid GPS coordinates: ({lats[i]:.6f}, {lons[i]:.6f})"
+            return False, f"Waypoint {i+1} outside geofence: ({lats[i]:.6f}, {lons[i]:.6f})"
         
         return True, "All waypoints within geofence"
 
 
+# Telemetry fields read by preflight_check (get_telemetry() always returns
+# the full dict)
+_preflight_fields = operator.itemgetter('lat', 'lon', 'armed')
+
+# wp.get('alt', 0) as a C-level callable, for max(map(...)) over waypoints
+_waypoint_alt = operator.methodcaller('get', 'alt', 0)
+
+
 def preflight_check(mavlink_manager, waypoints: List = None) -> Tuple[bool, List[Tuple[str, bool, str]]]:
     """
     Run comprehensive preflight checks
@@ -212,15 +332,13 @@ def preflight_check(mavlink_manager, waypoints: List = None) -> Tuple[bool, List
     
     try:
         telemetry = mavlink_manager.get_telemetry()
+        lat, lon, armed = _preflight_fields(telemetry)
         
         # Battery check
         battery_ok, battery_msg = check_battery_sufficient(telemetry)
-        battery = telemetry.get('battery', 0)
         checks.append(("Battery", battery_ok, battery_msg))
         
         # GPS lock check
-        lat = telemetry.get('lat', 0)
-        lon = telemetry.get('lon', 0)
         gps_ok = is_valid_gps(lat, lon) and lat != 0
         gps_msg = "GPS Lock OK" if gps_ok else "No GPS Fix"
         checks.append(("GPS Lock", gps_ok, gps_msg))
@@ -232,18 +350,17 @@ def preflight_check(mavlink_manager, waypoints: List = None) -> Tuple[bool, List
         
         # Waypoint validation
         if waypoints:
-            waypoint_count_ok = 1 <= len(waypoints) <= 100
-            wp_msg = f"{len(waypoints)} waypoints" if waypoint_count_ok else f"Invalid count: {len(waypoints)}"
+            count = len(waypoints)
+            waypoint_count_ok = 1 <= count <= 100
+            wp_msg = f"{count} waypoints" if waypoint_count_ok else f"Invalid count: {count}"
             checks.append(("Waypoints", waypoint_count_ok, wp_msg))
             
             # Altitude check
-            if waypoints:
-                max_alt = max(wp.get('alt', 0) for wp in waypoints)
-                alt_ok, alt_msg = validate_altitude(max_alt)
-                checks.append(("Max Altitude", alt_ok, f"{max_alt}m - {alt_msg}"))
+            max_alt = max(map(_waypoint_alt, waypoints))
+            alt_ok, alt_msg = validate_altitude(max_alt)
+            checks.append(("Max Altitude", alt_ok, f"{max_alt}m - {alt_msg}"))
         
         # Armed status check (should be disarmed before mission upload)
-        armed = telemetry.get('armed', False)
         disarmed_ok = not armed
         armed_msg = "Disarmed (ready)" if disarmed_ok else "Armed (warning)"
         checks.append(("Armed State", disarmed_ok, armed_msg))
@@ -261,6 +378,8 @@ def preflight_check(mavlink_manager, waypoints: List = None) -> Tuple[bool, List
 class PerformanceMonitor:
     """Monitor performance metrics like FPS and processing time"""
     
+    __slots__ = ('timings', 'window_size', 'start_time', '_sum')
+    
     def __init__(self, window_size: int = 30):
         """
         Initialize performance monitor
@@ -268,46 +387,49 @@ class PerformanceMonitor:
         Args:
             window_size: Number of samples to average over
         """
-        self.timings = []
+        # Samples are integer nanoseconds (perf_counter_ns); conversion to
+        # seconds/ms happens only in the getters
+        self.timings = deque(maxlen=window_size)
         self.window_size = window_size
         self.start_time = None
+        self._sum = 0  # Running sum of self.timings, exact in integer ns
     
     def start(self):
         """Start timing"""
-        self.start_time = time.time()
+        self.start_time = time.perf_counter_ns()
     
     def end(self):
         """End timing and record"""
         if self.start_time is None:
             return
         
-        elapsed = time.time() - self.start_time
-        self.timings.append(elapsed)
+        elapsed = time.perf_counter_ns() - self.start_time
         
-        # Keep only recent timings
-        if len(self.timings) > self.window_size:
-            self.timings = self.timings[-self.window_size:]
+        # The deque drops its oldest sample once full; keep the sum in step
+        timings = self.timings
+        if timings and len(timings) == self.window_size:
+            self._sum -= timings[0]
+        timings.append(elapsed)
+        self._sum += elapsed
         
         self.start_time = None
     
     def get_fps(self) -> float:
         """Get average FPS"""
-        if not self.timings:
-            return 0.0
-        avg_time = sum(self.timings) / len(self.timings)
+        avg_time = self.get_avg_time()
         return 1.0 / avg_time if avg_time > 0 else 0.0
     
     def get_avg_time(self) -> float:
         """Get average processing time in seconds"""
         if not self.timings:
             return 0.0
-        return sum(self.timings) / len(self.timings)
+        return self._sum / len(self.timings) / 1e9
     
     def get_stats(self) -> Dict[str, float]:
         """Get all statistics"""
         return {
             'fps': self.get_fps(),
             'avg_time_ms': self.get_avg_time() * 1000,
-            'min_time_ms': min(self.timings) * 1000 if self.timings else 0,
-            'max_time_ms': max(self.timings) * 1000 if self.timings else 0
+            'min_time_ms': min(self.timings) / 1e6 if self.timings else 0,
+            'max_time_ms': max(self.timings) / 1e6 if self.timings else 0
         }
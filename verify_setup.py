@@ -3,28 +3,36 @@ System Verification Script
 Run this to verify all components are properly installed
 """
 
+import os
 import sys
-import importlib
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 
-def check_module(module_name, package_name=None):
-    """Check if a Python module is installed"""
+def module_installed(module_name):
+    """Return True if a Python module can be located (it is not imported)"""
     try:
-        importlib.import_module(module_name)
-        print(f"✓ {package_name or module_name} - OK")
-        return True
-    except ImportError:
-        print(f"✗ {package_name or module_name} - NOT FOUND")
+        # find_spec only resolves the module; heavy packages like torch are
+        # not executed. Parent packages of dotted names are still imported
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
         return False
 
+def report(ok, name):
+    """Print one OK / NOT FOUND result line"""
+    if ok:
+        print(f"✓ {name} - OK")
+    else:
+        print(f"✗ {name} - NOT FOUND")
+    return ok
+
 def check_file(file_path, description):
     """Check if a file exists"""
-    import os
-    if os.path.exists(file_path):
-        print(f"✓ {description} - OK")
-        return True
-    else:
-        print(f"✗ {description} - NOT FOUND")
-        return False
+    return report(os.path.exists(file_path), description)
+
+def probe_all(probe, names):
+    """Run ``probe`` over ``names`` concurrently; results keep the input order"""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return list(executor.map(probe, names))
 
 def main():
     print("=" * 60)
@@ -57,8 +65,9 @@ def main():
     ]
     
     all_ok = True
-    for module, package in modules:
-        if not check_module(module, package):
+    found = probe_all(module_installed, [module for module, _ in modules])
+    for ok, (_, package) in zip(found, modules):
+        if not report(ok, package):
             all_ok = False
     print()
     
@@ -78,8 +87,9 @@ def main():
         ("requirements.txt", "Requirements file"),
     ]
     
-    for file_path, description in files:
-        if not check_file(file_path, description):
+    found = probe_all(os.path.exists, [file_path for file_path, _ in files])
+    for ok, (_, description) in zip(found, files):
+        if not report(ok, description):
             all_ok = False
     print()
     